@@ -0,0 +1,167 @@
+"""Grade recorded interview transcripts offline.
+
+Reads JSONL records with ``candidate``, ``job_role``, ``boss_type``,
+``question`` and ``answer`` and grades each answer with the same prompts as
+the live app. Once every answer of a candidate/role/persona is graded, a
+final summary is generated for it. Results are appended to the output JSONL
+as they complete; the output file doubles as the checkpoint, so re-running
+the same command after a crash only grades what is missing:
+
+    python batch_grade.py transcripts.jsonl -o graded.jsonl --workers 8
+    python batch_grade.py transcripts.jsonl -o graded.jsonl --backend local
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from InterviewSimulator import ModelClient, evaluation_prompt, final_feedback_prompt, load_config
+
+REQUIRED_FIELDS = ("candidate", "job_role", "boss_type", "question", "answer")
+
+
+def read_records(path):
+    """Load input records; a record's position in the list is its stable id."""
+    records = []
+    with open(path, encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, 1):
+            if not line.strip():
+                continue
+
+            record = json.loads(line)
+            missing = [field for field in REQUIRED_FIELDS if field not in record]
+            if missing:
+                raise ValueError(f"{path}:{line_number}: missing {', '.join(missing)}")
+
+            records.append(record)
+
+    return records
+
+
+def group_key(record):
+    return record["candidate"], record["job_role"], record["boss_type"]
+
+
+def load_checkpoint(path):
+    """Return finished evaluations and summaries from a previous run.
+
+    A crash can leave a half-written last line; it is cut off so appending
+    resumes on a clean line boundary.
+    """
+    evaluations, summaries = {}, set()
+    if not os.path.exists(path):
+        return evaluations, summaries
+
+    with open(path, "rb+") as handle:
+        data = handle.read()
+        end = data.rfind(b"\n") + 1
+        if end != len(data):
+            handle.truncate(end)
+
+    for line in data[:end].decode("utf-8").splitlines():
+        result = json.loads(line)
+        if result["type"] == "evaluation":
+            evaluations[result["index"]] = result["feedback"]
+        elif result["type"] == "summary":
+            summaries.add((result["candidate"], result["job_role"], result["boss_type"]))
+
+    return evaluations, summaries
+
+
+def grade(records, output_path, client, workers):
+    """Grade everything not yet in the checkpoint; return run statistics."""
+    evaluations, summaries = load_checkpoint(output_path)
+    groups = defaultdict(list)
+    for index, record in enumerate(records):
+        groups[group_key(record)].append(index)
+
+    remaining = {key: sum(i not in evaluations for i in indices) for key, indices in groups.items()}
+    pending = deque(i for i in range(len(records)) if i not in evaluations)
+    # Groups that were fully graded before a crash but never summarized
+    ready = [key for key, count in remaining.items() if count == 0 and key not in summaries]
+
+    stats = {"evaluations": 0, "summaries": 0, "failures": 0, "skipped": len(evaluations)}
+
+    def evaluate(index):
+        record = records[index]
+        prompt = evaluation_prompt(record["question"], record["answer"])
+        return client.generate("evaluate_answer", prompt).text
+
+    def summarize(key):
+        feedback = [evaluations[i] for i in groups[key]]
+        return client.generate("get_final_feedback", final_feedback_prompt(feedback)).text
+
+    with open(output_path, "a", encoding="utf-8") as output, ThreadPoolExecutor(workers) as pool:
+        def write(result):
+            output.write(json.dumps(result) + "\n")
+            output.flush()
+
+        in_flight = {}
+        while pending or ready or in_flight:
+            # Keep a bounded number of calls in flight instead of queueing everything
+            while ready and len(in_flight) < workers * 2:
+                key = ready.pop()
+                in_flight[pool.submit(summarize, key)] = ("summary", key)
+            while pending and len(in_flight) < workers * 2:
+                index = pending.popleft()
+                in_flight[pool.submit(evaluate, index)] = ("evaluation", index)
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                kind, item = in_flight.pop(future)
+                try:
+                    feedback = future.result()
+                except Exception as exc:
+                    stats["failures"] += 1
+                    print(f"failed {kind} {item}: {exc}", file=sys.stderr)
+                    continue
+
+                if kind == "evaluation":
+                    # The input record is nested so its fields (e.g. a question "type")
+                    # cannot overwrite the checkpoint's own keys
+                    evaluations[item] = feedback
+                    write({"type": "evaluation", "index": item, "input": records[item], "feedback": feedback})
+                    stats["evaluations"] += 1
+
+                    key = group_key(records[item])
+                    remaining[key] -= 1
+                    if remaining[key] == 0:
+                        ready.append(key)
+                else:
+                    candidate, job_role, boss_type = item
+                    write({"type": "summary", "candidate": candidate, "job_role": job_role,
+                           "boss_type": boss_type, "feedback": feedback})
+                    stats["summaries"] += 1
+
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Grade recorded interview transcripts offline.")
+    parser.add_argument("input", help="JSONL file of transcript records")
+    parser.add_argument("-o", "--output", required=True, help="JSONL results file (also the checkpoint)")
+    parser.add_argument("--workers", type=int, default=8, help="concurrent model calls")
+    parser.add_argument("--backend", choices=["gemini", "local", "replay"], help="model backend override")
+    args = parser.parse_args(argv)
+
+    config = load_config({"backend": args.backend} if args.backend else None)
+    records = read_records(args.input)
+
+    start = time.perf_counter()
+    stats = grade(records, args.output, ModelClient(config), args.workers)
+    elapsed = time.perf_counter() - start
+
+    calls = stats["evaluations"] + stats["summaries"]
+    print(f"graded {stats['evaluations']} answers and {stats['summaries']} summaries "
+          f"in {elapsed:.2f}s ({calls / elapsed if elapsed else 0:.1f} calls/s); "
+          f"{stats['skipped']} already done, {stats['failures']} failed",
+          file=sys.stderr)
+
+    return 1 if stats["failures"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""Compare per-request overhead of the JSON API against the Gradio UI path.
+
+Both paths run against the local stand-in backend, which answers instantly,
+so the numbers are framework overhead only:
+
+    python benchmarks/bench_api.py --requests 200
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from InterviewSimulator import InterviewSimulator, create_app  # noqa: E402
+from interview_api import create_api  # noqa: E402
+
+LOCAL = {"backend": "local"}
+
+
+def report(name, samples):
+    samples = sorted(samples)
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(f"{name:>10}: median {statistics.median(samples) * 1000:7.2f} ms  "
+          f"p95 {p95 * 1000:7.2f} ms  ({len(samples)} requests)")
+
+
+def bench_api(requests):
+    from fastapi.testclient import TestClient
+
+    client = TestClient(create_api(LOCAL))
+    session_id = client.post("/sessions", json={"job_role": "Engineer"}).json()["session_id"]
+
+    samples = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        client.post(f"/sessions/{session_id}/answer", json={"answer": "An answer."}).raise_for_status()
+        samples.append(time.perf_counter() - start)
+
+    return samples
+
+
+def bench_ui(requests, tiered=False):
+    """Time SUBMIT through Gradio; ``tiered`` uses the default pre-score-then-evaluate handler."""
+    from gradio_client import Client
+
+    demo = create_app(engine=InterviewSimulator(config={**LOCAL, "tiered_evaluation": tiered}))
+    _, url, _ = demo.launch(prevent_thread_lock=True, quiet=True)
+    try:
+        client = Client(url, verbose=False)
+        # Keywords only, so optional inputs (candidate, question count) keep their UI defaults
+        client.predict(boss_type="Neutral", job_role="Engineer", api_name="/start_interview_with_progress")
+
+        samples = []
+        for _ in range(requests):
+            start = time.perf_counter()
+            client.predict("An answer.", api_name="/submit_answer")
+            samples.append(time.perf_counter() - start)
+    finally:
+        demo.close()
+
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    report("json api", bench_api(args.requests))
+    report("gradio ui", bench_ui(args.requests))
+    report("tiered ui", bench_ui(args.requests, tiered=True))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Compare single-call and parallel-section final feedback latency.
+
+Uses a synthetic model whose latency grows with the number of sections it is
+asked to write (a fixed time-to-first-token plus generation time per
+section), which is how a real LLM call behaves:
+
+    python benchmarks/bench_final_feedback.py --base 0.4 --per-section 1.5
+"""
+import argparse
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from InterviewSimulator import InterviewSimulator, ModelClient, load_config  # noqa: E402
+
+
+class SyntheticModel:
+    def __init__(self, base, per_section):
+        self.base = base
+        self.per_section = per_section
+
+    def generate_content(self, prompt, **kwargs):
+        sections = prompt.split("Feedback:")[0].count(":**")
+        time.sleep(self.base + self.per_section * sections)
+
+        return SimpleNamespace(text=f"{sections} section(s) of feedback.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base", type=float, default=0.4, help="seconds before any output")
+    parser.add_argument("--per-section", type=float, default=1.5, help="seconds to write one section")
+    args = parser.parse_args()
+
+    config = load_config()
+    engine = InterviewSimulator(config=config, client=ModelClient(config, SyntheticModel(args.base, args.per_section)))
+    engine.state["feedback"] = ["**Communication Score (1-10):** 7"] * 6
+
+    start = time.perf_counter()
+    engine.get_final_feedback()
+    single = time.perf_counter() - start
+    print(f"  single: first content {single:5.2f}s  complete {single:5.2f}s")
+
+    start = time.perf_counter()
+    arrivals = [time.perf_counter() - start for _ in engine.get_final_feedback_sections()]
+    print(f"parallel: first content {arrivals[0]:5.2f}s  complete {arrivals[-1]:5.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Check MinHash accuracy against exact Jaccard and time a repeat check.
+
+Prints exact and estimated similarity for known question pairs and exits
+non-zero if an estimate is further off than MinHash noise allows (about
+three standard deviations for ``NUM_PERM`` permutations):
+
+    python benchmarks/bench_question_history.py --history 200
+"""
+import argparse
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from question_history import NUM_PERM, QuestionHistory, shingles, signature  # noqa: E402
+
+PAIRS = [
+    ("Tell me about a time you led a team through a hard deadline?",
+     "Tell me about a time when you led a team through a hard deadline?"),
+    ("How do you prioritize when several tasks are urgent at the same time?",
+     "How do you prioritize when several urgent tasks arrive at the same time?"),
+    ("Describe a time you received critical feedback. What did you do with it?",
+     "Describe a time you received critical feedback and what you changed."),
+    ("What is a project you are especially proud of, and what was your role in it?",
+     "Which project are you most proud of, and what was your role?"),
+    ("Explain how a hash map handles collisions.",
+     "Describe a situation where you had to meet a tight deadline."),
+]
+
+
+def jaccard(a, b):
+    a, b = shingles(a), shingles(b)
+    return len(a & b) / len(a | b)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--history", type=int, default=200, help="past questions for the timing run")
+    args = parser.parse_args()
+
+    failures = 0
+    for a, b in PAIRS:
+        exact = jaccard(a, b)
+        estimate = float(np.mean(signature(a) == signature(b)))
+        tolerance = max(0.05, 3 * math.sqrt(exact * (1 - exact) / NUM_PERM))
+        ok = abs(estimate - exact) <= tolerance
+        failures += not ok
+        print(f"exact {exact:4.2f}  estimate {estimate:4.2f}  {'ok' if ok else 'OFF'}  {a[:50]}")
+
+    # Past questions built from random words, so they overlap the pairs only by chance
+    rng = np.random.default_rng(0)
+    vocabulary = sorted({word for pair in PAIRS for question in pair for word in question.lower().split()})
+    history = QuestionHistory()
+    history.add("candidate", [" ".join(rng.choice(vocabulary, 10)) + "?" for _ in range(args.history)])
+    start = time.perf_counter()
+    history.find_duplicates("candidate", [b for _, b in PAIRS])
+    elapsed = (time.perf_counter() - start) / len(PAIRS) * 1000
+    print(f"repeat check: {elapsed:.3f} ms per question against {args.history} past questions")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+"""Re-run recorded production sessions offline against replayed model traffic.
+
+Sessions come from a transcript log (see ``transcript_log.py``) and model
+responses from a cassette recorded with ``record_cassette``. Every session is
+driven through the full engine, so the numbers reflect this build's own
+overhead plus the recorded model latency scaled by ``--speed``. Sessions
+start at their recorded arrival times (the transcript log's ``questions``
+timestamps), also scaled by ``--speed``; ``--speed 0`` starts them all at once:
+
+    python benchmarks/bench_replay.py transcripts.jsonl cassette.jsonl --speed 10 --concurrency 32
+
+The local fallback is disabled, so a prompt the cassette cannot answer fails
+its session instead of being scored locally; failures are reported.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from InterviewSimulator import InterviewSimulator, ModelClient, load_config  # noqa: E402
+
+
+def load_sessions(path):
+    """Group transcript log records into per-session scripts, in arrival order."""
+    sessions = defaultdict(lambda: {"start": None, "ts": None, "answers": [], "summary": False})
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+
+            record = json.loads(line)
+            session = sessions[record["session_id"]]
+            if record["event"] == "questions":
+                session["start"] = (record["boss_type"], record["job_role"])
+                session["ts"] = record["ts"]
+            elif record["event"] == "evaluation":
+                session["answers"].append((record["question"], record["answer"]))
+            elif record["event"] == "summary":
+                session["summary"] = True
+
+    return sorted((session for session in sessions.values() if session["start"]), key=lambda s: s["ts"])
+
+
+def arrival_offsets(sessions):
+    """Seconds after the first session at which each session arrived in production."""
+    first = sessions[0]["ts"] if sessions else 0.0
+
+    return [session["ts"] - first for session in sessions]
+
+
+def run_session(client, config, session, scheduled):
+    """Replay one session; return its start lag and the latency of each turn in seconds."""
+    lag = time.perf_counter() - scheduled
+    engine = InterviewSimulator(config=config, client=client)
+    turns = []
+
+    start = time.perf_counter()
+    engine.generate_questions(*session["start"])
+    turns.append(time.perf_counter() - start)
+
+    for question, answer in session["answers"]:
+        start = time.perf_counter()
+        engine.evaluate_answer(question, answer)
+        engine.next_question()
+        turns.append(time.perf_counter() - start)
+
+    if session["summary"]:
+        start = time.perf_counter()
+        engine.get_final_feedback()
+        turns.append(time.perf_counter() - start)
+
+    return lag, turns
+
+
+def percentile(values, fraction):
+    return values[max(0, int(len(values) * fraction) - 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("transcripts", help="transcript log JSONL")
+    parser.add_argument("cassette", help="cassette JSONL recorded with record_cassette")
+    parser.add_argument("--speed", type=float, default=1.0, help="replay speed; 0 means no delays at all")
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+
+    config = load_config({
+        "backend": "replay",
+        "replay_cassette": args.cassette,
+        "replay_speed": args.speed,
+        "local_fallback": False,
+    })
+    client = ModelClient(config)
+    sessions = load_sessions(args.transcripts)
+    offsets = arrival_offsets(sessions)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(args.concurrency) as pool:
+        futures = []
+        for session, offset in zip(sessions, offsets):
+            scheduled = start + (offset / args.speed if args.speed else 0)
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            futures.append(pool.submit(run_session, client, config, session, scheduled))
+
+        lags, turns, failures = [], [], 0
+        for future in futures:
+            try:
+                lag, result = future.result()
+            except Exception as exc:
+                failures += 1
+                print(f"session failed: {exc!r}", file=sys.stderr)
+                continue
+
+            lags.append(lag)
+            turns += result
+    elapsed = time.perf_counter() - start
+
+    calls = sum(counters["calls"] + counters["coalesced"] for counters in client.stats.values())
+    lookups = client.model.stats
+    print(f"{len(sessions)} sessions ({failures} failed), {len(turns)} turns, {calls} model calls in {elapsed:.2f}s")
+    print(f"replay lookups: {lookups['exact']} exact, {lookups['by_kind']} by prompt kind, "
+          f"{lookups['missing']} missing")
+    if not turns:
+        return 1
+
+    turns.sort()
+    lags.sort()
+    print(f"throughput: {len(lags) / elapsed:.1f} sessions/s, {len(turns) / elapsed:.1f} turns/s")
+    print(f"turn latency: median {statistics.median(turns) * 1000:.1f} ms, "
+          f"p95 {percentile(turns, 0.95) * 1000:.1f} ms")
+    print(f"start lag behind the recorded arrivals: median {statistics.median(lags) * 1000:.1f} ms, "
+          f"p95 {percentile(lags, 0.95) * 1000:.1f} ms")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
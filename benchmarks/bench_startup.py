@@ -0,0 +1,63 @@
+"""Measure cold import time and time-to-ready of the interview simulator.
+
+Each measurement runs in a fresh interpreter so nothing is already imported:
+
+    python benchmarks/bench_startup.py --runs 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import json, time
+t0 = time.perf_counter()
+import InterviewSimulator as app
+t1 = time.perf_counter()
+engine = app.create_engine()
+t2 = time.perf_counter()
+result = {"import": t1 - t0, "engine": t2 - t1}
+try:
+    app.create_app(engine=engine)
+    result["app"] = time.perf_counter() - t2
+except ImportError as exc:
+    result["app_error"] = str(exc)
+result["ready"] = time.perf_counter() - t0
+print(json.dumps(result))
+"""
+
+
+def run_probe():
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    runs = [run_probe() for _ in range(args.runs)]
+
+    for key in ("import", "engine", "app", "ready"):
+        samples = [run[key] for run in runs if key in run]
+        if samples:
+            print(f"{key:>8}: median {statistics.median(samples) * 1000:8.1f} ms  "
+                  f"min {min(samples) * 1000:8.1f} ms")
+
+    if "app_error" in runs[0]:
+        print(f"     app: skipped ({runs[0]['app_error']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Measure the payload the Gradio UI pushes to the browser per event.
+
+Runs one full interview against the local stand-in backend over Gradio's
+queue protocol and reports the bytes of every output event (streamed
+``process_generating`` updates and the final ``process_completed``), grouped
+by handler:
+
+    python benchmarks/bench_ui_updates.py --questions 5 --final-feedback-mode parallel
+
+Frame time is measured in the browser: open the app, run an interview and
+read ``interviewPerf`` in the developer console (scroll frames, time spent
+scrolling, long animation frames and progress updates).
+"""
+import argparse
+import os
+import statistics
+import sys
+import uuid
+from collections import defaultdict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from InterviewSimulator import InterviewSimulator, create_app  # noqa: E402
+
+OUTPUT_EVENTS = ('"msg":"process_generating"', '"msg":"process_completed"')
+
+
+def run_event(client, fn_index, data):
+    """Trigger one event and return the byte size of each output message."""
+    session_hash = uuid.uuid4().hex
+    client.post("gradio_api/queue/join", json={
+        "data": data, "fn_index": fn_index, "session_hash": session_hash,
+        "event_data": None, "trigger_id": None,
+    }).raise_for_status()
+
+    sizes = []
+    with client.stream("GET", "gradio_api/queue/data", params={"session_hash": session_hash}) as stream:
+        for line in stream.iter_lines():
+            if any(marker in line for marker in OUTPUT_EVENTS):
+                sizes.append(len(line.encode()))
+            if OUTPUT_EVENTS[1] in line:
+                break
+
+    return sizes
+
+
+def main():
+    import httpx
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--questions", type=int, default=5)
+    parser.add_argument("--final-feedback-mode", choices=["single", "parallel"], default="parallel")
+    args = parser.parse_args()
+
+    config = {"backend": "local", "final_feedback_mode": args.final_feedback_mode}
+    demo = create_app(engine=InterviewSimulator(config=config))
+    _, url, _ = demo.launch(prevent_thread_lock=True, quiet=True)
+    try:
+        with httpx.Client(base_url=url, timeout=60) as client:
+            handlers = {dep["api_name"]: dep["id"] for dep in client.get("config").json()["dependencies"]}
+            finish = next(name for name in handlers if name.startswith("finish_interview"))
+
+            sizes = defaultdict(list)
+            sizes["start_interview"] += run_event(client, handlers["start_interview_with_progress"],
+                                                  ["Neutral", "Engineer", "", args.questions])
+            for _ in range(args.questions + 1):
+                sizes["submit_answer"] += run_event(client, handlers["submit_answer"],
+                                                    ["An answer about a project I led."])
+                sizes["next_question"] += run_event(client, handlers["next_question_with_progress"], [])
+            sizes[finish] += run_event(client, handlers[finish], [])
+    finally:
+        demo.close()
+
+    for name, values in sizes.items():
+        print(f"{name:>30}: {len(values):3d} events  median {statistics.median(values):6.0f} B  "
+              f"max {max(values):6d} B  total {sum(values):7d} B")
+
+
+if __name__ == "__main__":
+    main()
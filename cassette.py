@@ -0,0 +1,129 @@
+"""Record model traffic to a cassette file and replay it offline.
+
+A cassette is JSONL with one entry per model call: stage, prompt, response
+text (and chunks for streamed calls), how long the call took and when it
+started relative to the first recorded call. Callers that shared an
+in-flight call (single-flight) get their own entry flagged ``coalesced``, so
+bursts of identical requests are kept in the record; replay serves
+responses from the non-coalesced entries only. ``ReplayModel`` serves a
+cassette through the same ``generate_content`` interface as the Gemini model,
+sleeping for the recorded latency divided by ``speed`` (``speed=0`` answers
+immediately).
+"""
+import json
+import threading
+import time
+from collections import defaultdict, deque
+from types import SimpleNamespace
+
+
+def prompt_kind(prompt):
+    """First line of a prompt, e.g. ``Evaluate this interview response:``."""
+    return prompt.split("\n", 1)[0].strip()
+
+
+class CassetteRecorder:
+    """Appends one JSON line per model call; safe to share between threads."""
+
+    def __init__(self, path):
+        self.path = path
+        self._handle = open(path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+        self._origin = None
+
+    def record(self, stage, prompt, started, latency, text, chunks=None, coalesced=False):
+        with self._lock:
+            if self._origin is None:
+                self._origin = started
+
+            entry = {
+                "stage": stage,
+                "prompt": prompt,
+                "offset": round(started - self._origin, 6),
+                "latency": round(latency, 6),
+                "text": text,
+            }
+            if chunks is not None:
+                entry["chunks"] = chunks
+            if coalesced:
+                entry["coalesced"] = True
+
+            self._handle.write(json.dumps(entry) + "\n")
+            self._handle.flush()
+
+    def wrap_stream(self, stage, prompt, started, chunks):
+        """Pass streamed chunks through, recording the call once it finishes."""
+        texts = []
+        for chunk in chunks:
+            texts.append(chunk.text)
+            yield chunk
+
+        self.record(stage, prompt, started, time.perf_counter() - started, "".join(texts), texts)
+
+
+class ReplayModel:
+    """Serves recorded responses; matches on the exact prompt first.
+
+    Prompts that were never recorded (for example because a new build
+    changed the wording) fall back to responses recorded for the same kind
+    of prompt, taken in turn.
+    """
+
+    def __init__(self, path, speed=1.0):
+        self.speed = speed
+        self._by_prompt = defaultdict(deque)
+        self._by_kind = defaultdict(list)
+        self._kind_turn = defaultdict(int)
+        self._lock = threading.Lock()
+        # How each lookup was served: exact prompt, same kind of prompt, or not at all
+        self.stats = {"exact": 0, "by_kind": 0, "missing": 0}
+
+        with open(path, encoding="utf-8") as handle:
+            for line in handle:
+                if line.strip():
+                    entry = json.loads(line)
+                    if entry.get("coalesced"):
+                        continue
+
+                    self._by_prompt[entry["prompt"]].append(entry)
+                    self._by_kind[prompt_kind(entry["prompt"])].append(entry)
+
+    def _lookup(self, prompt):
+        with self._lock:
+            exact = self._by_prompt.get(prompt)
+            if exact:
+                # Rotate so repeated prompts get their recorded responses in order
+                entry = exact[0]
+                exact.rotate(-1)
+                self.stats["exact"] += 1
+                return entry
+
+            kind = prompt_kind(prompt)
+            entries = self._by_kind.get(kind)
+            if not entries:
+                self.stats["missing"] += 1
+                raise KeyError(f"No recorded response for prompt starting {kind!r}")
+
+            entry = entries[self._kind_turn[kind] % len(entries)]
+            self._kind_turn[kind] += 1
+            self.stats["by_kind"] += 1
+            return entry
+
+    def _delay(self, seconds):
+        if self.speed:
+            time.sleep(seconds / self.speed)
+
+    def generate_content(self, prompt, stream=False, **kwargs):
+        entry = self._lookup(prompt)
+
+        if not stream:
+            self._delay(entry["latency"])
+            return SimpleNamespace(text=entry["text"])
+
+        return self._stream(entry)
+
+    def _stream(self, entry):
+        chunks = entry.get("chunks") or [entry["text"]]
+        for text in chunks:
+            self._delay(entry["latency"] / len(chunks))
+            yield SimpleNamespace(text=text)
@@ -0,0 +1,230 @@
+"""Headless JSON API for the interview engine.
+
+Serves the same InterviewSimulator used by the Gradio UI, without the UI:
+
+    uvicorn interview_api:app --port 8000
+
+Every session gets its own InterviewSimulator, all sharing one ModelClient.
+The answer and final-feedback endpoints stream Server-Sent Events when called
+with ``?stream=true``.
+
+Sessions idle for longer than ``api_session_ttl`` seconds are expired, and
+past ``api_max_sessions`` the least recently used one is evicted.
+"""
+import asyncio
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from fastapi import FastAPI, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+
+from InterviewSimulator import (
+    MAX_QUESTION_COUNT,
+    InterviewSimulator,
+    ModelClient,
+    create_question_history,
+    load_config,
+)
+from tracing import tracer
+from transcript_log import create_transcript_log
+
+
+class SessionRequest(BaseModel):
+    boss_type: str = "Neutral"
+    job_role: str
+    candidate: str | None = None
+    question_count: int | None = Field(None, ge=1, le=MAX_QUESTION_COUNT)
+
+
+# Each bulk item starts its own question-generation call
+MAX_BULK_SESSIONS = 100
+
+
+class BulkSessionRequest(BaseModel):
+    sessions: list[SessionRequest] = Field(max_length=MAX_BULK_SESSIONS)
+
+
+class AnswerRequest(BaseModel):
+    answer: str
+
+
+class SessionStore:
+    """Thread-safe map of session id to InterviewSimulator, with idle expiry and an LRU cap."""
+
+    def __init__(self, config, client, log=None, history=None):
+        self.config = config
+        self.client = client
+        self.log = log
+        self.history = history
+        self.ttl = config["api_session_ttl"]
+        self.max_sessions = config["api_max_sessions"]
+        # session id -> (simulator, last used), least recently used first
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+        self.evicted = 0
+
+    def create(self, boss_type, job_role, candidate=None, question_count=None):
+        simulator = InterviewSimulator(config=self.config, client=self.client, log=self.log, history=self.history)
+        simulator.state["boss_type"] = boss_type
+        simulator.state["job_role"] = job_role
+        simulator.generate_questions(boss_type, job_role, candidate, question_count)
+
+        session_id = simulator.session_id
+        with self._lock:
+            self._sessions[session_id] = (simulator, time.monotonic())
+            self._expire()
+
+        return session_id, simulator
+
+    def get(self, session_id):
+        with self._lock:
+            self._expire()
+            entry = self._sessions.get(session_id)
+            if entry is not None:
+                self._sessions[session_id] = (entry[0], time.monotonic())
+                self._sessions.move_to_end(session_id)
+
+        if entry is None:
+            raise HTTPException(status_code=404, detail="Unknown session id")
+
+        return entry[0]
+
+    def __len__(self):
+        with self._lock:
+            return len(self._sessions)
+
+    def _expire(self):
+        """Drop idle sessions and, past the cap, the least recently used ones; call with the lock held."""
+        cutoff = time.monotonic() - self.ttl
+        while self._sessions:
+            session_id, (_, last_used) = next(iter(self._sessions.items()))
+            if last_used >= cutoff and len(self._sessions) <= self.max_sessions:
+                break
+
+            del self._sessions[session_id]
+            self.evicted += 1
+
+    def delete(self, session_id):
+        with self._lock:
+            if self._sessions.pop(session_id, None) is None:
+                raise HTTPException(status_code=404, detail="Unknown session id")
+
+
+def session_payload(session_id, simulator):
+    """JSON view of a session's progress."""
+    state = simulator.state
+    complete = state["interview_complete"]
+
+    return {
+        "session_id": session_id,
+        "boss_type": state["boss_type"],
+        "job_role": state["job_role"],
+        "question_number": min(state["current_question"] + 1, len(state["questions"])),
+        "total_questions": len(state["questions"]),
+        "question": None if complete else state["questions"][state["current_question"]],
+        "question_type": None if complete else state["question_types"][state["current_question"]],
+        "interview_complete": complete,
+    }
+
+
+def sse(chunks):
+    """Wrap a text generator as a Server-Sent Events stream.
+
+    A failure mid-stream (e.g. a model error) ends the stream with an
+    ``error`` event instead of a dropped connection.
+    """
+    try:
+        for chunk in chunks:
+            yield f"event: chunk\ndata: {json.dumps({'text': chunk})}\n\n"
+    except Exception as exc:
+        yield f"event: error\ndata: {json.dumps({'error': type(exc).__name__, 'detail': str(exc)})}\n\n"
+        return
+
+    yield "event: done\ndata: {}\n\n"
+
+
+def create_api(config=None, client=None):
+    """Build the FastAPI app; the model client is shared by all sessions."""
+    config = load_config(config)
+    tracer.configure(config["trace_file"], config["trace_sample_rate"])
+    store = SessionStore(config, client or ModelClient(config), create_transcript_log(config),
+                         create_question_history(config))
+    api = FastAPI(title="Interview Simulator API")
+    api.state.sessions = store
+
+    @api.get("/stats")
+    def stats():
+        return {
+            "sessions": len(store),
+            "sessions_evicted": store.evicted,
+            "model_calls": store.client.stats,
+            "transcript_log": store.log.stats() if store.log else None,
+        }
+
+    @api.post("/sessions")
+    def create_session(request: SessionRequest):
+        session_id, simulator = store.create(request.boss_type, request.job_role, request.candidate,
+                                             request.question_count)
+
+        return session_payload(session_id, simulator)
+
+    @api.post("/sessions/bulk")
+    async def create_sessions(request: BulkSessionRequest):
+        created = await asyncio.gather(*[
+            run_in_threadpool(store.create, item.boss_type, item.job_role, item.candidate, item.question_count)
+            for item in request.sessions
+        ])
+
+        return {"sessions": [session_payload(*item) for item in created]}
+
+    @api.get("/sessions/{session_id}")
+    def get_session(session_id: str):
+        return session_payload(session_id, store.get(session_id))
+
+    @api.delete("/sessions/{session_id}")
+    def delete_session(session_id: str):
+        store.delete(session_id)
+
+        return {"deleted": session_id}
+
+    @api.post("/sessions/{session_id}/answer")
+    def submit_answer(session_id: str, request: AnswerRequest, stream: bool = False):
+        simulator = store.get(session_id)
+        if simulator.state["interview_complete"]:
+            raise HTTPException(status_code=409, detail="Interview is already complete")
+
+        question = simulator.state["questions"][simulator.state["current_question"]]
+        if stream:
+            return StreamingResponse(
+                sse(simulator.evaluate_answer_stream(question, request.answer)),
+                media_type="text/event-stream",
+            )
+
+        return {"session_id": session_id, "feedback": simulator.evaluate_answer(question, request.answer)}
+
+    @api.post("/sessions/{session_id}/next")
+    def next_question(session_id: str):
+        simulator = store.get(session_id)
+        simulator.next_question()
+
+        return session_payload(session_id, simulator)
+
+    @api.get("/sessions/{session_id}/feedback")
+    def final_feedback(session_id: str, stream: bool = False):
+        simulator = store.get(session_id)
+        if stream:
+            return StreamingResponse(
+                sse(simulator.get_final_feedback_stream()),
+                media_type="text/event-stream",
+            )
+
+        return {"session_id": session_id, "feedback": simulator.get_final_feedback()}
+
+    return api
+
+
+app = create_api()
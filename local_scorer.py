@@ -0,0 +1,156 @@
+"""Instant local pre-score of an answer, shown before the LLM evaluation.
+
+Scores come from a few cheap text signals: answer length, STAR structure
+markers, coverage of the question's keywords, filler-word rate and sentence
+length. Each score is a linear combination of those signals. The default
+weights are hand-set; ``calibrate()`` refits them against the scores the LLM
+gave in the transcript log.
+"""
+import argparse
+import glob
+import json
+import os
+import re
+
+from transcript_log import read_events
+
+FEATURES = ("bias", "length", "star", "coverage", "fluency", "sentences")
+
+DEFAULT_WEIGHTS = {
+    "communication": [1.0, 2.0, 1.5, 0.5, 3.0, 2.0],
+    "content": [1.0, 2.0, 3.0, 3.5, 0.0, 0.5],
+}
+
+STAR_MARKERS = {
+    "situation": ("situation", "when i was", "at my", "in my previous", "in my last", "we were", "context"),
+    "task": ("task", "goal", "responsible", "needed to", "had to", "challenge", "objective"),
+    "action": ("i decided", "i built", "i led", "i created", "implemented", "i worked", "approach", "i started"),
+    "result": ("result", "outcome", "increased", "reduced", "improved", "saved", "learned", "achieved", "%"),
+}
+
+FILLERS = ("um", "uh", "like", "you know", "basically", "actually", "literally", "sort of", "kind of", "i mean")
+
+STOPWORDS = {
+    "about", "after", "also", "been", "being", "could", "describe", "does", "from", "have", "into",
+    "more", "most", "other", "some", "tell", "than", "that", "their", "them", "then", "there", "these",
+    "they", "this", "those", "through", "what", "when", "where", "which", "while", "with", "would",
+    "your", "yourself", "time", "give", "example",
+}
+
+_WORD = re.compile(r"[a-z0-9']+")
+
+
+def features(question, answer):
+    """Signals in the 0-1 range, in ``FEATURES`` order."""
+    text = answer.lower()
+    words = _WORD.findall(text)
+    count = len(words)
+
+    # Full marks between 80 and 250 words, tapering off either side
+    if count < 80:
+        length = count / 80
+    else:
+        length = max(0.0, 1 - max(0, count - 250) / 250)
+
+    star = sum(any(marker in text for marker in markers) for markers in STAR_MARKERS.values()) / len(STAR_MARKERS)
+
+    keywords = {w[:5] for w in _WORD.findall(question.lower()) if len(w) > 3 and w not in STOPWORDS}
+    stems = {w[:5] for w in words}
+    coverage = len(keywords & stems) / len(keywords) if keywords else 0.5
+
+    padded = f" {' '.join(words)} "
+    filler_count = sum(padded.count(f" {filler} ") for filler in FILLERS)
+    fluency = max(0.0, 1 - 10 * filler_count / count) if count else 0.0
+
+    sentences = [s for s in re.split(r"[.!?]+", answer) if s.strip()]
+    average = count / len(sentences) if sentences else 0
+    sentence_score = 1.0 if 8 <= average <= 25 else 0.5 if average else 0.0
+
+    return [1.0, length, star, coverage, fluency, sentence_score]
+
+
+class LocalScorer:
+    """Linear scorer over ``features()``; weights may come from ``calibrate()``."""
+
+    def __init__(self, weights_path=None):
+        self.weights = DEFAULT_WEIGHTS
+        self.calibrated = False
+        if weights_path and os.path.exists(weights_path):
+            with open(weights_path, encoding="utf-8") as handle:
+                self.weights = json.load(handle)
+            self.calibrated = True
+
+    def score(self, question, answer):
+        values = features(question, answer)
+        scores = {
+            metric: min(10, max(1, round(sum(w * v for w, v in zip(weights, values)))))
+            for metric, weights in self.weights.items()
+        }
+
+        return scores, dict(zip(FEATURES[1:], values[1:]))
+
+    def score_card(self, question, answer, fallback=False):
+        """Markdown in the same shape as the LLM evaluation, marked provisional."""
+        scores, signals = self.score(question, answer)
+        tips = []
+        if signals["length"] < 0.6:
+            tips.append("Add more detail; aim for roughly 80-250 words.")
+        if signals["star"] < 0.75:
+            tips.append("Structure it as Situation, Task, Action and Result.")
+        if signals["coverage"] < 0.5:
+            tips.append("Address the key terms of the question more directly.")
+        if signals["fluency"] < 0.7:
+            tips.append("Cut filler words such as 'um', 'like' and 'basically'.")
+
+        if fallback:
+            summary = "The detailed evaluation is unavailable right now; this is a quick local check."
+        else:
+            summary = "Quick local check while the detailed evaluation is prepared."
+
+        return (f"**Communication Score (1-10):** {scores['communication']} *(provisional)*\n"
+                f"**Content Score (1-10):** {scores['content']} *(provisional)*\n"
+                f"**Overall Feedback:** {summary}\n"
+                f"**Improvement Suggestions:** {' '.join(tips) or 'Looks well structured so far.'}")
+
+
+def calibrate(transcript_pattern, weights_path):
+    """Fit the scorer's weights to LLM scores logged in transcript files (JSONL or SQLite).
+
+    Uses least squares over every evaluation record that has an LLM score;
+    returns the number of records used.
+    """
+    import numpy as np
+
+    rows, targets = [], {"communication": [], "content": []}
+    for path in sorted(glob.glob(transcript_pattern)):
+        for record in read_events(path)[0]:
+            if record.get("event") != "evaluation" or record.get("source") == "local":
+                continue
+            if record.get("communication") is None or record.get("content") is None:
+                continue
+
+            rows.append(features(record["question"], record["answer"]))
+            for metric in targets:
+                targets[metric].append(record[metric])
+
+    if len(rows) < len(FEATURES):
+        raise ValueError(f"Need at least {len(FEATURES)} scored evaluations to calibrate, found {len(rows)}")
+
+    matrix = np.array(rows)
+    weights = {
+        metric: np.linalg.lstsq(matrix, np.array(values, dtype=float), rcond=None)[0].round(4).tolist()
+        for metric, values in targets.items()
+    }
+    with open(weights_path, "w", encoding="utf-8") as handle:
+        json.dump(weights, handle, indent=2)
+
+    return len(rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Calibrate the local scorer against logged LLM scores.")
+    parser.add_argument("transcripts", help="glob of transcript log files, e.g. 'transcripts*.jsonl' or 'transcripts*.db'")
+    parser.add_argument("weights", help="output JSON file (the local_scorer_weights config value)")
+    args = parser.parse_args()
+
+    print(f"calibrated on {calibrate(args.transcripts, args.weights)} evaluations")
@@ -0,0 +1,163 @@
+"""Per-candidate history of asked questions, indexed with MinHash/LSH.
+
+Only fixed-size MinHash signatures are kept (no question text), so a
+candidate's history costs ``NUM_PERM * 4`` bytes per question. Signatures are
+split into LSH bands; a new question is compared only against past questions
+sharing at least one band, which keeps a check well under a millisecond.
+"""
+import atexit
+import hashlib
+import os
+import re
+import sys
+import threading
+
+import numpy as np
+
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+MERSENNE_PRIME = (1 << 61) - 1
+# Bumped whenever signatures change, so stale history files are not matched against
+SIGNATURE_VERSION = 2
+
+_rng = np.random.RandomState(1)
+_PERM_A = _rng.randint(1, MERSENNE_PRIME, NUM_PERM, dtype=np.uint64)
+_PERM_B = _rng.randint(1, MERSENNE_PRIME, NUM_PERM, dtype=np.uint64)
+
+
+def shingles(question):
+    """Word bigrams of a question, ignoring numbering, case and punctuation."""
+    words = re.sub(r"[^a-z0-9 ]", " ", question.lower()).split()
+    if words and words[0].isdigit():
+        words = words[1:]
+    if len(words) < 2:
+        return set(words)
+
+    return {f"{a} {b}" for a, b in zip(words, words[1:])}
+
+
+def _mod_prime(x):
+    """``x mod 2^61-1`` for uint64 ``x``, using ``2^61 = 1 (mod p)``."""
+    x = (x & MERSENNE_PRIME) + (x >> 61)
+    return np.where(x >= MERSENNE_PRIME, x - MERSENNE_PRIME, x)
+
+
+def _permute(hashes):
+    """``(a * h + b) mod 2^61-1`` for every permutation and 32-bit hash, exact in uint64.
+
+    ``a`` is split into 29 high and 32 low bits so no product overflows.
+    """
+    hashes = hashes[None, :]
+    low = _mod_prime((_PERM_A & 0xFFFFFFFF)[:, None] * hashes)
+    high = (_PERM_A >> 32)[:, None] * hashes
+    # high * 2^32, folding the bits above 2^61 back to the bottom
+    high = (high >> 29) + ((high & ((1 << 29) - 1)) << 32)
+
+    return _mod_prime(_mod_prime(low + high) + _PERM_B[:, None])
+
+
+def signature(question):
+    """MinHash signature (``NUM_PERM`` uint32 values) of a question."""
+    hashes = np.fromiter(
+        (int.from_bytes(hashlib.blake2b(s.encode(), digest_size=4).digest(), "little")
+         for s in shingles(question) or {""}),
+        dtype=np.uint64,
+    )
+
+    return (_permute(hashes).min(axis=1) & 0xFFFFFFFF).astype(np.uint32)
+
+
+def normalize(candidate):
+    """Treat ``Jane@Example.com `` and ``jane@example.com`` as the same candidate."""
+    return candidate.strip().lower()
+
+
+def _bands(sig):
+    return [sig[i * ROWS:(i + 1) * ROWS].tobytes() for i in range(BANDS)]
+
+
+class QuestionHistory:
+    """Near-duplicate index of the questions each candidate has been asked."""
+
+    def __init__(self, path=None, threshold=0.5, max_per_candidate=500):
+        self.path = path
+        self.threshold = threshold
+        self.max_per_candidate = max_per_candidate
+        self._signatures = {}
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+        if path and os.path.exists(path):
+            self._load(path)
+        if path:
+            atexit.register(self.save)
+
+    def find_duplicates(self, candidate, questions):
+        """Indices of ``questions`` that are near-duplicates of past ones."""
+        candidate = normalize(candidate)
+        with self._lock:
+            history = self._signatures.get(candidate)
+            buckets = self._buckets.get(candidate)
+            if not history:
+                return []
+
+            duplicates = []
+            for index, question in enumerate(questions):
+                sig = signature(question)
+                matches = set()
+                for band, key in enumerate(_bands(sig)):
+                    matches.update(buckets.get((band, key), ()))
+
+                if any(np.mean(history[m] == sig) >= self.threshold for m in matches):
+                    duplicates.append(index)
+
+        return duplicates
+
+    def add(self, candidate, questions):
+        """Remember questions asked to a candidate, dropping the oldest past the cap."""
+        candidate = normalize(candidate)
+        with self._lock:
+            history = self._signatures.setdefault(candidate, [])
+            history.extend(signature(q) for q in questions)
+            if len(history) > self.max_per_candidate:
+                del history[:len(history) - self.max_per_candidate]
+
+            self._reindex(candidate)
+
+    def save(self, path=None):
+        path = path or self.path
+        with self._lock:
+            candidates = list(self._signatures)
+            if not candidates:
+                return
+
+            counts = np.array([len(self._signatures[c]) for c in candidates], dtype=np.int64)
+            stacked = np.vstack([np.vstack(self._signatures[c]) for c in candidates])
+
+        # np.savez appends .npz when missing, so write through a file handle
+        with open(path + ".tmp", "wb") as handle:
+            np.savez_compressed(handle, candidates=np.array(candidates), counts=counts, signatures=stacked,
+                                version=SIGNATURE_VERSION)
+        os.replace(path + ".tmp", path)
+
+    def _load(self, path):
+        with np.load(path) as data:
+            if "version" not in data or int(data["version"]) != SIGNATURE_VERSION:
+                print(f"ignoring question history {path}: written by an older signature version",
+                      file=sys.stderr)
+                return
+
+            offsets = np.concatenate([[0], np.cumsum(data["counts"])])
+            signatures = data["signatures"]
+            for i, candidate in enumerate(data["candidates"].tolist()):
+                self._signatures[candidate] = list(signatures[offsets[i]:offsets[i + 1]])
+                self._reindex(candidate)
+
+    def _reindex(self, candidate):
+        buckets = {}
+        for position, sig in enumerate(self._signatures[candidate]):
+            for band, key in enumerate(_bands(sig)):
+                buckets.setdefault((band, key), []).append(position)
+
+        self._buckets[candidate] = buckets
@@ -0,0 +1,265 @@
+"""Columnar store and vectorized analytics for evaluation scores.
+
+Scores are read from the transcript log's ``evaluation`` records and kept as
+NumPy arrays: timestamps, dictionary-encoded job role / interviewer / question
+codes and the two 1-10 scores. The table is cached as a single ``.npz`` file
+together with how far each transcript file has been read, so refreshing only
+parses new records. Both transcript log formats (JSONL and SQLite) are read. Every aggregate is a handful of ``bincount``/``lexsort``
+passes over the arrays, with no per-row Python work.
+"""
+import glob
+import json
+import os
+import time
+
+import numpy as np
+
+from transcript_log import read_events
+
+METRICS = ("communication", "content")
+GROUPS = ("job_role", "boss_type", "question")
+SCORE_LEVELS = 10
+
+
+class ScoreTable:
+    """Append-only columnar table of evaluation scores."""
+
+    def __init__(self):
+        self.ts = np.empty(0, dtype=np.float64)
+        self.codes = {group: np.empty(0, dtype=np.int32) for group in GROUPS}
+        self.scores = {metric: np.empty(0, dtype=np.int8) for metric in METRICS}
+        self.labels = {group: [] for group in GROUPS}
+        self.sources = {}
+        self._lookup = {group: {} for group in GROUPS}
+
+    def __len__(self):
+        return len(self.ts)
+
+    def _code(self, group, label):
+        lookup = self._lookup[group]
+        if label not in lookup:
+            lookup[label] = len(self.labels[group])
+            self.labels[group].append(label)
+
+        return lookup[label]
+
+    def extend(self, records):
+        """Append evaluation records (dicts as written by the transcript log).
+
+        Only model scores are kept; provisional local scores logged while the
+        model was unavailable (``source == "local"``) are skipped.
+        """
+        rows = [
+            r for r in records
+            if r.get("source") != "local" and r.get("communication") is not None and r.get("content") is not None
+        ]
+        if not rows:
+            return
+
+        self.ts = np.concatenate([self.ts, np.fromiter((r["ts"] for r in rows), np.float64, len(rows))])
+        for group in GROUPS:
+            new = np.fromiter((self._code(group, (r.get(group) or "").strip()) for r in rows), np.int32, len(rows))
+            self.codes[group] = np.concatenate([self.codes[group], new])
+        for metric in METRICS:
+            new = np.fromiter((min(max(r[metric], 1), SCORE_LEVELS) for r in rows), np.int8, len(rows))
+            self.scores[metric] = np.concatenate([self.scores[metric], new])
+
+    def ingest(self, pattern):
+        """Read new evaluation records from transcript log files matching a glob.
+
+        Each file is resumed from the position reached last time (a byte
+        offset for JSONL, a rowid for SQLite), so rotated files are read once
+        and the active file only for its new records. Files are tracked by
+        inode because rotation renames the active file.
+        """
+        for path in sorted(glob.glob(pattern)):
+            stat = os.stat(path)
+            key = f"{stat.st_dev}:{stat.st_ino}"
+            records, self.sources[key] = read_events(path, self.sources.get(key, 0))
+            self.extend(r for r in records if r.get("event") == "evaluation")
+
+        return self
+
+    def save(self, path):
+        np.savez_compressed(
+            path,
+            ts=self.ts,
+            **{f"code_{group}": self.codes[group] for group in GROUPS},
+            **{f"score_{metric}": self.scores[metric] for metric in METRICS},
+            meta=np.array(json.dumps({"labels": self.labels, "sources": self.sources})),
+        )
+
+    @classmethod
+    def load(cls, path):
+        table = cls()
+        with np.load(path) as data:
+            meta = json.loads(str(data["meta"]))
+            table.ts = data["ts"]
+            table.codes = {group: data[f"code_{group}"] for group in GROUPS}
+            table.scores = {metric: data[f"score_{metric}"] for metric in METRICS}
+
+        table.labels = meta["labels"]
+        table.sources = meta["sources"]
+        table._lookup = {group: {label: i for i, label in enumerate(table.labels[group])} for group in GROUPS}
+
+        return table
+
+
+def load_table(cache_path, transcript_pattern=None):
+    """Load the cached table, pull in new transcript lines and re-save it."""
+    table = ScoreTable.load(cache_path) if os.path.exists(cache_path) else ScoreTable()
+    if transcript_pattern:
+        before = len(table)
+        table.ingest(transcript_pattern)
+        if len(table) != before:
+            table.save(cache_path)
+
+    return table
+
+
+def grouped(table, group, percentiles=(25, 50, 75)):
+    """Count, mean and percentiles of both scores for every value of a group.
+
+    Returns a list of rows ``[label, count, mean_comm, mean_content, p.. comm, p.. content]``
+    sorted by count.
+    """
+    codes = table.codes[group]
+    size = len(table.labels[group])
+    counts = np.bincount(codes, minlength=size)
+    present = counts > 0
+
+    columns = []
+    for metric in METRICS:
+        sums = np.bincount(codes, weights=table.scores[metric], minlength=size)
+        columns.append(np.divide(sums, counts, out=np.zeros(size), where=present))
+    for metric in METRICS:
+        columns.extend(group_percentiles(codes, table.scores[metric], counts, percentiles))
+
+    order = np.argsort(-counts, kind="stable")
+    labels = table.labels[group]
+
+    return [
+        [labels[i], int(counts[i])] + [round(float(column[i]), 2) for column in columns]
+        for i in order if present[i]
+    ]
+
+
+def group_percentiles(codes, values, counts, percentiles):
+    """Nearest-rank percentiles of ``values`` within each group, in one sort."""
+    order = np.lexsort((values, codes))
+    sorted_values = values[order]
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    last = np.maximum(counts - 1, 0)
+
+    result = []
+    for percentile in percentiles:
+        index = starts + np.floor(last * percentile / 100).astype(np.int64)
+        column = np.zeros(len(counts))
+        has_rows = counts > 0
+        column[has_rows] = sorted_values[index[has_rows]]
+        result.append(column)
+
+    return result
+
+
+def question_difficulty(table, min_count=5, limit=20):
+    """Hardest questions first: lowest mean content score among frequently asked ones."""
+    rows = [row for row in grouped(table, "question", percentiles=()) if row[1] >= min_count]
+    rows.sort(key=lambda row: row[3])
+
+    return rows[:limit]
+
+
+def distribution_over_time(table, metric, bucket_seconds=86400):
+    """Histogram of a score per time bucket.
+
+    Returns ``(bucket_starts, counts)`` where ``counts[i, s - 1]`` is how many
+    scores equal to ``s`` fell in bucket ``i``.
+    """
+    if not len(table):
+        return np.empty(0), np.zeros((0, SCORE_LEVELS), dtype=np.int64)
+
+    buckets = (table.ts // bucket_seconds).astype(np.int64)
+    first = buckets.min()
+    buckets -= first
+    size = int(buckets.max()) + 1
+    flat = buckets * SCORE_LEVELS + (table.scores[metric].astype(np.int64) - 1)
+    counts = np.bincount(flat, minlength=size * SCORE_LEVELS).reshape(size, SCORE_LEVELS)
+
+    return (np.arange(size) + first) * bucket_seconds, counts
+
+
+def transcript_pattern(config):
+    """Glob matching the transcript log and its rotated files."""
+    if not config.get("transcript_log"):
+        return None
+
+    base, ext = os.path.splitext(config["transcript_log"])
+
+    return f"{base}*{ext}"
+
+
+def create_admin_tab(config):
+    """Add the score dashboard to the enclosing Blocks."""
+    import gradio as gr
+
+    percentile_headers = [f"{metric[:4]}. p{p}" for metric in METRICS for p in (25, 50, 75)]
+    group_headers = ["count", "avg comm.", "avg content"] + percentile_headers
+
+    summary = gr.Markdown()
+    refresh_button = gr.Button("REFRESH", elem_classes="secondary-button")
+    by_role = gr.Dataframe(headers=["job role"] + group_headers, label="By job role")
+    by_boss = gr.Dataframe(headers=["interviewer"] + group_headers, label="By interviewer vibe")
+    hardest = gr.Dataframe(headers=["question", "count", "avg comm.", "avg content"],
+                           label="Hardest questions (lowest content score)")
+    over_time = gr.Dataframe(headers=["day", "count", "avg content"] + [str(s) for s in range(1, SCORE_LEVELS + 1)],
+                             label="Content score distribution per day")
+
+    def refresh():
+        start = time.perf_counter()
+        table = load_table(config["score_table"], transcript_pattern(config))
+
+        days, counts = distribution_over_time(table, "content")
+        totals = counts.sum(axis=1)
+        means = np.divide(counts @ np.arange(1, SCORE_LEVELS + 1), totals,
+                          out=np.zeros(len(totals)), where=totals > 0)
+        daily = [
+            [time.strftime("%Y-%m-%d", time.gmtime(day)), int(total), round(float(mean), 2)] + row.tolist()
+            for day, total, mean, row in zip(days, totals, means, counts) if total
+        ]
+
+        elapsed = (time.perf_counter() - start) * 1000
+
+        return (
+            f"**{len(table):,} evaluations** analyzed in {elapsed:.0f} ms",
+            grouped(table, "job_role"),
+            grouped(table, "boss_type"),
+            question_difficulty(table),
+            daily,
+        )
+
+    refresh_button.click(refresh, outputs=[summary, by_role, by_boss, hardest, over_time])
+
+
+def create_admin_app(config):
+    """Standalone Blocks for the score dashboard, kept out of the candidate-facing app."""
+    import gradio as gr
+
+    with gr.Blocks(title="Interview Simulator Admin") as admin:
+        gr.Markdown("# Score Analytics")
+        create_admin_tab(config)
+
+    return admin
+
+
+def launch_admin_app(config):
+    """Serve the dashboard on its own local port, never shared, without blocking."""
+    username, _, password = (config["admin_auth"] or "").partition(":")
+
+    return create_admin_app(config).launch(
+        server_name="127.0.0.1",
+        server_port=config["admin_port"],
+        share=False,
+        auth=(username, password) if username else None,
+        prevent_thread_lock=True,
+    )
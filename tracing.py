@@ -0,0 +1,220 @@
+"""Lightweight span tracing exported as a Chrome trace file.
+
+Spans nest through a context variable and are written as Chrome trace
+``"X"`` events, so the file opens directly in ``chrome://tracing`` or
+https://ui.perfetto.dev for flame views. The file is a JSON array that is
+never closed, which both viewers accept, so it can be appended to while the
+app runs.
+
+Sampling is decided once per root span and inherited by its children. When
+tracing is disabled, or a trace is not sampled, ``span()`` returns a shared
+no-op object, so instrumented code pays one attribute check per span.
+
+Streams are traced with ``span_iter()``: one span covers the whole iteration
+but is current only while the next item is produced, never across a
+``yield``, so a stream may be resumed from another thread or context (as
+Starlette does for streaming responses).
+"""
+import atexit
+import contextvars
+import functools
+import inspect
+import json
+import os
+import random
+import threading
+import time
+
+_current = contextvars.ContextVar("interview_span", default=None)
+
+
+class _NoopSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, **attrs):
+        pass
+
+
+NOOP = _NoopSpan()
+
+
+class _UnsampledSpan(_NoopSpan):
+    """Root of a trace that was not sampled; silences its children."""
+
+    def __enter__(self):
+        self._token = _current.set(self)
+        return self
+
+    def __exit__(self, *exc):
+        _current.reset(self._token)
+        return False
+
+
+class Span:
+    __slots__ = ("tracer", "name", "attrs", "start", "_token")
+
+    def __init__(self, tracer, name, attrs):
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+
+    def __enter__(self):
+        self._inherit()
+        self._token = _current.set(self)
+        self.start = time.perf_counter_ns()
+        return self
+
+    def _inherit(self):
+        parent = _current.get()
+        if isinstance(parent, Span) and "session_id" in parent.attrs:
+            self.attrs.setdefault("session_id", parent.attrs["session_id"])
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        _current.reset(self._token)
+        if exc_type is not None:
+            self.attrs["error"] = exc_type.__name__
+        self.tracer.export(self, end)
+        return False
+
+    def set(self, **attrs):
+        """Attach attributes (token counts, sizes, ...) to the span."""
+        self.attrs.update(attrs)
+
+
+class Tracer:
+    """Creates spans and appends finished ones to the trace file."""
+
+    def __init__(self):
+        self.enabled = False
+        self.sample_rate = 1.0
+        self._file = None
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def configure(self, path, sample_rate=1.0):
+        """Start writing spans to ``path``; a falsy path disables tracing."""
+        self.close()
+        self.sample_rate = sample_rate
+        if not path:
+            return
+
+        new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+        self._file = open(path, "a", encoding="utf-8")
+        if new_file:
+            self._file.write("[\n")
+        self.enabled = True
+
+    def span(self, name, **attrs):
+        if not self.enabled:
+            return NOOP
+
+        parent = _current.get()
+        if parent is None:
+            if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+                return _UnsampledSpan()
+        elif not isinstance(parent, Span):
+            return NOOP
+
+        return Span(self, name, attrs)
+
+    def span_iter(self, name, iterable, **attrs):
+        """Yield from ``iterable`` inside one span covering the whole iteration.
+
+        Records the number of items and the time to the first one.
+        """
+        current = self.span(name, **attrs)
+        if current is NOOP:
+            yield from iterable
+            return
+
+        if isinstance(current, Span):
+            current._inherit()
+            current.start = time.perf_counter_ns()
+
+        iterator = iter(iterable)
+        count = 0
+        try:
+            while True:
+                token = _current.set(current)
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    break
+                finally:
+                    _current.reset(token)
+
+                if count == 0:
+                    current.set(first_item_ms=(time.perf_counter_ns() - current.start) / 1e6)
+                count += 1
+                yield item
+        except Exception as exc:
+            current.set(error=type(exc).__name__)
+            raise
+        finally:
+            if isinstance(current, Span):
+                current.set(items=count)
+                self.export(current, time.perf_counter_ns())
+
+    def export(self, span, end):
+        event = {
+            "name": span.name,
+            "cat": span.attrs.get("stage", "interview"),
+            "ph": "X",
+            "ts": span.start / 1000,
+            "dur": (end - span.start) / 1000,
+            "pid": self._pid,
+            "tid": threading.get_native_id(),
+            "args": span.attrs,
+        }
+        line = json.dumps(event, default=str) + ",\n"
+        with self._lock:
+            if self._file is not None:
+                self._file.write(line)
+
+    def close(self):
+        with self._lock:
+            self.enabled = False
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+tracer = Tracer()
+span = tracer.span
+span_iter = tracer.span_iter
+atexit.register(tracer.close)
+
+
+def traced(name, **attrs):
+    """Decorator that runs a function inside a span.
+
+    Generator functions stay generator functions (Gradio streams them), and
+    their span covers the whole iteration via ``span_iter()``.
+    """
+    def decorate(fn):
+        if inspect.isgeneratorfunction(fn):
+            @functools.wraps(fn)
+            def generator_wrapper(*args, **kwargs):
+                if not tracer.enabled:
+                    return (yield from fn(*args, **kwargs))
+
+                return (yield from tracer.span_iter(name, fn(*args, **kwargs), **attrs))
+
+            return generator_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return fn(*args, **kwargs)
+
+            with tracer.span(name, **attrs):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
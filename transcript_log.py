@@ -0,0 +1,314 @@
+"""Write-behind log of interview transcripts and evaluations.
+
+Handlers only put a record on a bounded in-memory queue; a background thread
+drains it in batches to an append-only JSONL file or SQLite database, rotating
+by size or age. When the queue is full the ``drop`` policy discards the
+record and the ``block`` policy waits up to ``block_timeout`` seconds before
+dropping, so logging never stalls a request indefinitely.
+
+A batch that fails to write (full disk, locked database, a field that is not
+JSON-serializable) is retried record by record; whatever still fails is
+counted in ``write_errors`` and ``failed`` and the writer keeps running.
+"""
+import atexit
+import json
+import os
+import queue
+import sqlite3
+import sys
+import threading
+import time
+
+_STOP = object()
+
+
+class JsonlSink:
+    """Append-only JSONL file."""
+
+    suffix = ".jsonl"
+
+    def __init__(self, path):
+        self.path = path
+        self.handle = open(path, "a", encoding="utf-8")
+
+    def write(self, records):
+        self.handle.write("".join(json.dumps(record) + "\n" for record in records))
+        self.handle.flush()
+
+    def close(self):
+        self.handle.close()
+
+
+class SqliteSink:
+    """Append-only SQLite table; each record's fields are stored as JSON."""
+
+    suffix = ".db"
+
+    def __init__(self, path):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS events "
+            "(ts REAL, session_id TEXT, event TEXT, payload TEXT)"
+        )
+
+    def write(self, records):
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO events VALUES (?, ?, ?, ?)",
+                [(r["ts"], r["session_id"], r["event"], json.dumps(r)) for r in records],
+            )
+
+    def close(self):
+        self.connection.close()
+
+
+SINKS = {"jsonl": JsonlSink, "sqlite": SqliteSink}
+
+SQLITE_HEADER = b"SQLite format 3\x00"
+
+
+def read_events(path, position=0):
+    """Records written to a transcript log file (either format) after ``position``.
+
+    Returns ``(records, position)``; pass the position back to read only newer
+    records. For JSONL it is a byte offset, and a partially written last line
+    is left for next time; for SQLite it is the last rowid read.
+    """
+    with open(path, "rb") as handle:
+        is_sqlite = handle.read(len(SQLITE_HEADER)) == SQLITE_HEADER
+
+    if is_sqlite:
+        connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            rows = connection.execute(
+                "SELECT rowid, payload FROM events WHERE rowid > ? ORDER BY rowid", (position,)
+            ).fetchall()
+        finally:
+            connection.close()
+
+        return [json.loads(payload) for _, payload in rows], rows[-1][0] if rows else position
+
+    with open(path, "rb") as handle:
+        handle.seek(position)
+        data = handle.read()
+
+    end = data.rfind(b"\n") + 1
+
+    return [json.loads(line) for line in data[:end].splitlines() if line.strip()], position + end
+
+
+class TranscriptLog:
+    """Bounded queue plus a writer thread that flushes batches to a sink."""
+
+    def __init__(self, path, fmt="jsonl", max_queue=10000, policy="drop", block_timeout=0.05,
+                 batch_size=256, flush_interval=0.5, max_bytes=64 * 1024 * 1024, max_age=24 * 3600):
+        if fmt not in SINKS:
+            raise ValueError(f"Unknown transcript log format: {fmt}")
+        if policy not in ("drop", "block"):
+            raise ValueError(f"Unknown transcript log policy: {policy}")
+
+        self.path = path
+        self.sink_class = SINKS[fmt]
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+
+        self.queue = queue.Queue(max_queue)
+        self.metrics = {
+            "enqueued": 0,
+            "dropped": 0,
+            "blocked": 0,
+            "written": 0,
+            "flushes": 0,
+            "rotations": 0,
+            "write_errors": 0,
+            "failed": 0,
+            "max_depth": 0,
+            "last_flush_seconds": 0.0,
+        }
+        self._metrics_lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="transcript-log", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def record(self, session_id, event, **fields):
+        """Queue one record without waiting on disk."""
+        item = {"ts": time.time(), "session_id": session_id, "event": event, **fields}
+
+        # Nothing drains the queue once the writer is gone; don't make callers wait on it
+        if not self._thread.is_alive():
+            self._count("dropped")
+            return False
+
+        try:
+            self.queue.put_nowait(item)
+        except queue.Full:
+            if self.policy == "drop":
+                self._count("dropped")
+                return False
+
+            self._count("blocked")
+            try:
+                self.queue.put(item, timeout=self.block_timeout)
+            except queue.Full:
+                self._count("dropped")
+                return False
+
+        with self._metrics_lock:
+            self.metrics["enqueued"] += 1
+            self.metrics["max_depth"] = max(self.metrics["max_depth"], self.queue.qsize())
+
+        return True
+
+    def stats(self):
+        """Snapshot of the backpressure counters and current queue depth."""
+        with self._metrics_lock:
+            return {**self.metrics, "depth": self.queue.qsize(), "writer_alive": self._thread.is_alive()}
+
+    def close(self):
+        """Flush everything still queued and stop the writer thread.
+
+        Returns False when the writer had already died, after reporting how
+        many records were left unwritten.
+        """
+        if self._closed:
+            return True
+
+        self._closed = True
+        if self._thread.is_alive():
+            self.queue.put(_STOP)
+            self._thread.join()
+            return True
+
+        print(f"transcript log writer for {self.path} had stopped; "
+              f"{self.queue.qsize()} queued records were not written", file=sys.stderr)
+        return False
+
+    def _count(self, name):
+        with self._metrics_lock:
+            self.metrics[name] += 1
+
+    def _open(self):
+        self._opened = time.time()
+        return self.sink_class(self.path)
+
+    def _rotate(self, sink):
+        too_big = os.path.getsize(self.path) >= self.max_bytes
+        too_old = time.time() - self._opened >= self.max_age
+        if not (too_big or too_old):
+            return sink
+
+        sink.close()
+        base, _ = os.path.splitext(self.path)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        rotated = f"{base}.{stamp}{self.sink_class.suffix}"
+        counter = 1
+        while os.path.exists(rotated):
+            rotated = f"{base}.{stamp}-{counter}{self.sink_class.suffix}"
+            counter += 1
+        os.replace(self.path, rotated)
+        self._count("rotations")
+
+        return self._open()
+
+    def _write(self, sink, batch):
+        """Write a batch, falling back to one record at a time if it fails."""
+        if sink is None:
+            sink = self._open()
+
+        try:
+            sink.write(batch)
+            return sink, len(batch)
+        except Exception as exc:
+            self._count("write_errors")
+            print(f"transcript log write to {self.path} failed: {exc!r}", file=sys.stderr)
+
+        written = 0
+        for record in batch:
+            try:
+                sink.write([record])
+                written += 1
+            except Exception:
+                pass
+
+        with self._metrics_lock:
+            self.metrics["failed"] += len(batch) - written
+
+        return sink, written
+
+    def _run(self):
+        # The sink lives on this thread only (SQLite connections are thread-bound)
+        sink = None
+        stopping = False
+
+        while not stopping:
+            batch = []
+            try:
+                item = self.queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                item = None
+
+            while item is not None:
+                if item is _STOP:
+                    stopping = True
+                    break
+
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+
+                try:
+                    item = self.queue.get_nowait()
+                except queue.Empty:
+                    item = None
+
+            if not batch:
+                continue
+
+            start = time.perf_counter()
+            try:
+                sink, written = self._write(sink, batch)
+            except Exception as exc:
+                # The sink could not even be opened; count the batch and try again next time
+                sink, written = None, 0
+                with self._metrics_lock:
+                    self.metrics["write_errors"] += 1
+                    self.metrics["failed"] += len(batch)
+                print(f"transcript log {self.path} could not be opened: {exc!r}", file=sys.stderr)
+
+            with self._metrics_lock:
+                self.metrics["written"] += written
+                self.metrics["flushes"] += 1
+                self.metrics["last_flush_seconds"] = time.perf_counter() - start
+
+            if sink is not None:
+                try:
+                    sink = self._rotate(sink)
+                except Exception as exc:
+                    self._count("write_errors")
+                    print(f"transcript log rotation of {self.path} failed: {exc!r}", file=sys.stderr)
+                    sink.close()
+                    sink = None
+
+        if sink is not None:
+            sink.close()
+
+
+def create_transcript_log(config):
+    """Build the shared transcript log from config, or None when disabled."""
+    if not config.get("transcript_log"):
+        return None
+
+    return TranscriptLog(
+        config["transcript_log"],
+        fmt=config["transcript_log_format"],
+        max_queue=config["transcript_log_queue"],
+        policy=config["transcript_log_policy"],
+        max_bytes=config["transcript_log_max_bytes"],
+        max_age=config["transcript_log_max_age"],
+    )